@@ -3,96 +3,135 @@ Game configuration and constants module.
 Contains all game settings, dimensions, speeds, and colors.
 """
 
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Game configuration and constants"""
-    
-    def __init__(self):
-        # Display settings
-        self.WIDTH = 600
-        self.HEIGHT = 800
-        self.FPS = 60
-        
-        # Player settings
-        self.PLAYER_WIDTH = 50
-        self.PLAYER_HEIGHT = 50
-        self.PLAYER_SPEED = 7
-        self.PLAYER_START_Y_OFFSET = 20
-        self.PLAYER_STARTING_LIVES = 3  # Number of lives player starts with
-        self.PLAYER_INVINCIBILITY_TIME = 120  # Frames of invincibility after losing a life
-
-        # Power-up settings
-        self.POWER_UP_SPAWN_CHANCE = 0.02  # Chance per frame to spawn power-up
-        self.POWER_UP_SPEED_BOOST_MULTIPLIER = 1.5  # How much faster player moves
-        self.POWER_UP_SLOW_ENEMIES_FACTOR = 0.5  # How much slower enemies move
-        self.POWER_UP_SCORE_MULTIPLIER = 2  # Score multiplier value
-        
-        # Enemy settings
-        self.ENEMY_WIDTH = 50
-        self.ENEMY_HEIGHT = 50
-        self.ENEMY_BASE_SPEED = 5
-        self.ENEMY_BASE_SPAWN_RATE = 30  # Frames between spawns (lower = faster)
-        
-        # Difficulty scaling settings
-        self.DIFFICULTY_SCALING_ENABLED = True
-        self.SPEED_SCALE_FACTOR = 0.05  # Speed increase per difficulty level (reduced for slower progression)
-        self.SPAWN_RATE_SCALE_FACTOR = 0.05  # Spawn rate increase per difficulty level
-        
-        # Gradual difficulty progression (points required for each level)
-        self.DIFFICULTY_PROGRESSION = {
-            1: 0,      # Level 1 starts at 0 points
-            2: 20,     # Level 2 at 20 points
-            3: 40,     # Level 3 at 40 points
-            4: 80,     # Level 4 at 80 points
-            5: 160,    # Level 5 at 160 points
-            6: 320,    # Level 6 at 320 points
-            7: 640,    # Level 7 at 640 points
-            8: 1280,   # Level 8 at 1280 points
-            9: 2560,   # Level 9 at 2560 points
-            10: 5120   # Level 10 at 5120 points
-        }
-        self.MAX_DIFFICULTY_LEVEL = 10  # Maximum difficulty level cap
-        self.INITIAL_DIFFICULTY_LEVEL = 1
-        
-        # Advanced spawn rate progression
-        self.SPAWN_RATE_PROGRESSION_ENABLED = True
-        self.MIN_SPAWN_RATE = 8  # Fastest possible spawn rate (frames)
-        self.SPAWN_BURST_ENABLED = True  # Enable burst spawning at higher levels
-        self.BURST_SPAWN_COUNT = 3  # Number of enemies in a burst
-        self.BURST_SPAWN_INTERVAL = 200  # Frames between burst spawns
-        self.BURST_ACTIVATION_LEVEL = 5  # Level when burst spawning starts
-        
-        # Dynamic spawn patterns
-        self.DYNAMIC_SPAWN_PATTERNS = True
-        self.PATTERN_CHANGE_INTERVAL = 500  # Score points between pattern changes
-        self.SPAWN_PATTERNS = [
-            "random",      # Random positions
-            "wave",        # Wave-like pattern
-            "clustered",   # Clustered spawns
-            "alternating"  # Alternating sides
-        ]
-        
-        # Colors
-        self.WHITE = (255, 255, 255)
-        self.BLACK = (0, 0, 0)
-        self.RED = (255, 0, 0)
-        self.BLUE = (0, 100, 255)
-        
-        # Power-up settings
-        self.POWER_UP_SPAWN_CHANCE = 0.005  # Chance per frame to spawn power-up
-        self.POWER_UP_DURATION = 600  # Frames (10 seconds at 60 FPS)
-        self.POWER_UP_SIZE = 30  # Size of power-up squares
-        self.POWER_UP_TYPES = {
-            "speed_boost": {"color": (255, 255, 0), "effect": "player_speed"},  # Yellow - speed boost
-            "slow_motion": {"color": (0, 255, 255), "effect": "enemy_speed"},   # Cyan - slow enemies
-            "extra_life": {"color": (255, 0, 255), "effect": "lives"},          # Magenta - extra life
-            "shield": {"color": (255, 165, 0), "effect": "invincibility"}       # Orange - temporary shield
-        }
-
-        # UI settings
-        self.SCORE_POSITION = (10, 10)
-        self.DIFFICULTY_POSITION = (10, 40)  # Position for difficulty display
-        self.SPAWN_RATE_POSITION = (10, 100)  # Position for spawn rate display (moved down to avoid overlap)
-        self.LIVES_POSITION = (10, 130)  # Position for lives display (moved down)
-        self.POWER_UP_POSITION = (10, 160)  # Position for active power-up display (moved down)
-        self.GAME_OVER_Y_OFFSET = 0.5  # Center of screen
+    """Game configuration and constants (immutable, shared via CONFIG)"""
+
+    # Display settings
+    WIDTH: int = 600
+    HEIGHT: int = 800
+    FPS: int = 60
+    IDLE_FPS: int = 15  # Frame cap while the static game-over screen is up
+    UPDATE_RATE: int = 60  # Fixed game-logic steps per second (speeds are per step)
+    MAX_CATCHUP_STEPS: int = 4  # Most logic steps run in one frame after a stall
+
+    # Player settings
+    PLAYER_WIDTH: int = 50
+    PLAYER_HEIGHT: int = 50
+    PLAYER_SPEED: int = 7
+    PLAYER_START_Y_OFFSET: int = 20
+    PLAYER_STARTING_LIVES: int = 3  # Number of lives player starts with
+    PLAYER_INVINCIBILITY_TIME: int = 120  # Frames of invincibility after losing a life
+
+    # Power-up effect settings
+    POWER_UP_SPEED_BOOST_MULTIPLIER: float = 1.5  # How much faster player moves
+    POWER_UP_SLOW_ENEMIES_FACTOR: float = 0.5  # How much slower enemies move
+    POWER_UP_SCORE_MULTIPLIER: int = 2  # Score multiplier value
+
+    # Enemy settings
+    ENEMY_WIDTH: int = 50
+    ENEMY_HEIGHT: int = 50
+    ENEMY_BASE_SPEED: int = 5
+    ENEMY_BASE_SPAWN_RATE: int = 30  # Logic steps between spawns (lower = faster)
+    ENEMY_POOL_SIZE: int = 256  # Max retired enemy rects kept for reuse
+
+    # Difficulty scaling settings
+    DIFFICULTY_SCALING_ENABLED: bool = True
+    SPEED_SCALE_FACTOR: float = 0.05  # Speed increase per difficulty level (reduced for slower progression)
+    SPAWN_RATE_SCALE_FACTOR: float = 0.05  # Spawn rate increase per difficulty level
+
+    # Gradual difficulty progression: points required for each level, in
+    # level order (sorted, so the level for a score is a bisect away)
+    DIFFICULTY_THRESHOLDS: tuple = (
+        0,     # Level 1 starts at 0 points
+        20,    # Level 2 at 20 points
+        40,    # Level 3 at 40 points
+        80,    # Level 4 at 80 points
+        160,   # Level 5 at 160 points
+        320,   # Level 6 at 320 points
+        640,   # Level 7 at 640 points
+        1280,  # Level 8 at 1280 points
+        2560,  # Level 9 at 2560 points
+        5120   # Level 10 at 5120 points
+    )
+    MAX_DIFFICULTY_LEVEL: int = 10  # Maximum difficulty level cap
+    INITIAL_DIFFICULTY_LEVEL: int = 1
+
+    # Advanced spawn rate progression
+    SPAWN_RATE_PROGRESSION_ENABLED: bool = True
+    MIN_SPAWN_RATE: int = 8  # Fastest possible spawn rate (logic steps)
+    SPAWN_X_POOL_SIZE: int = 1024  # Random spawn x positions drawn per batch
+    SPAWN_BURST_ENABLED: bool = True  # Enable burst spawning at higher levels
+    BURST_SPAWN_COUNT: int = 3  # Number of enemies in a burst
+    BURST_SPAWN_INTERVAL: int = 200  # Frames between burst spawns
+    BURST_ACTIVATION_LEVEL: int = 5  # Level when burst spawning starts
+
+    # Dynamic spawn patterns
+    DYNAMIC_SPAWN_PATTERNS: bool = True
+    PATTERN_CHANGE_INTERVAL: int = 500  # Score points between pattern changes
+    SPAWN_PATTERNS: tuple = (
+        "random",      # Random positions
+        "wave",        # Wave-like pattern
+        "clustered",   # Clustered spawns
+        "alternating"  # Alternating sides
+    )
+
+    # Colors
+    WHITE: tuple = (255, 255, 255)
+    BLACK: tuple = (0, 0, 0)
+    RED: tuple = (255, 0, 0)
+    BLUE: tuple = (0, 100, 255)
+
+    # Power-up settings
+    POWER_UP_SPAWN_CHANCE: float = 0.005  # Chance per frame to spawn power-up
+    POWER_UP_DURATION: int = 600  # Logic steps (10 seconds at 60 steps per second)
+    POWER_UP_SIZE: int = 30  # Size of power-up squares
+    POWER_UP_TYPES: MappingProxyType = field(default_factory=lambda: MappingProxyType({
+        "speed_boost": {"color": (255, 255, 0), "effect": "player_speed"},  # Yellow - speed boost
+        "slow_motion": {"color": (0, 255, 255), "effect": "enemy_speed"},   # Cyan - slow enemies
+        "extra_life": {"color": (255, 0, 255), "effect": "lives"},          # Magenta - extra life
+        "shield": {"color": (255, 165, 0), "effect": "invincibility"}       # Orange - temporary shield
+    }))
+
+    # UI settings
+    SCORE_POSITION: tuple = (10, 10)
+    DIFFICULTY_POSITION: tuple = (10, 40)  # Position for difficulty display
+    SPAWN_RATE_POSITION: tuple = (10, 100)  # Position for spawn rate display (moved down to avoid overlap)
+    LIVES_POSITION: tuple = (10, 130)  # Position for lives display (moved down)
+    POWER_UP_POSITION: tuple = (10, 160)  # Position for active power-up display (moved down)
+    GAME_OVER_Y_OFFSET: float = 0.5  # Center of screen
+
+    def level_for_score(self, score):
+        """
+        Get the difficulty level reached at a given score.
+
+        Args:
+            score: Current game score
+
+        Returns:
+            int: Difficulty level, capped at MAX_DIFFICULTY_LEVEL
+        """
+        return min(bisect_right(self.DIFFICULTY_THRESHOLDS, score), self.MAX_DIFFICULTY_LEVEL)
+
+    def score_for_level(self, level):
+        """
+        Get the score required to reach a difficulty level.
+
+        Args:
+            level: Difficulty level (1-based)
+
+        Returns:
+            int or None: Required score, or None if the level does not exist
+        """
+        if 1 <= level <= len(self.DIFFICULTY_THRESHOLDS):
+            return self.DIFFICULTY_THRESHOLDS[level - 1]
+        return None
+
+
+# Shared configuration instance; Config is immutable so one copy serves every game
+CONFIG: Config = Config()
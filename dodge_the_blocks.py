@@ -2,41 +2,12 @@ import pygame
 import random
 import sys
 
+from config import CONFIG
+
 # Initialize Pygame
 pygame.init()
 
 
-class Config:
-    """Game configuration and constants"""
-    def __init__(self):
-        # Display settings
-        self.WIDTH = 600
-        self.HEIGHT = 800
-        self.FPS = 60
-        
-        # Player settings
-        self.PLAYER_WIDTH = 50
-        self.PLAYER_HEIGHT = 50
-        self.PLAYER_SPEED = 7
-        self.PLAYER_START_Y_OFFSET = 20
-        
-        # Enemy settings
-        self.ENEMY_WIDTH = 50
-        self.ENEMY_HEIGHT = 50
-        self.ENEMY_SPEED = 5
-        self.ENEMY_SPAWN_RATE = 30
-        
-        # Colors
-        self.WHITE = (255, 255, 255)
-        self.BLACK = (0, 0, 0)
-        self.RED = (255, 0, 0)
-        self.BLUE = (0, 100, 255)
-        
-        # UI settings
-        self.SCORE_POSITION = (10, 10)
-        self.GAME_OVER_Y_OFFSET = 0.5  # Center of screen
-
-
 class Player:
     def __init__(self, config, x, y):
         self.config = config
@@ -86,7 +57,7 @@ class Enemy:
     def __init__(self, config, x, y):
         self.config = config
         self.rect = pygame.Rect(x, y, config.ENEMY_WIDTH, config.ENEMY_HEIGHT)
-        self._speed = config.ENEMY_SPEED
+        self._speed = config.ENEMY_BASE_SPEED
         
     @property
     def speed(self):
@@ -122,7 +93,7 @@ class Enemy:
 
 class Game:
     def __init__(self):
-        self.config = Config()
+        self.config = CONFIG
         self.screen = pygame.display.set_mode((self.config.WIDTH, self.config.HEIGHT))
         pygame.display.set_caption("Dodge the Blocks")
         self.clock = pygame.time.Clock()
@@ -175,7 +146,7 @@ class Game:
     
     def spawn_enemy(self):
         """Spawn a new enemy at random x position"""
-        x = random.randint(0, self.config.WIDTH - self.config.ENEMY_WIDTH)
+        x = random.randrange(self.config.WIDTH - self.config.ENEMY_WIDTH + 1)
         enemy = Enemy(self.config, x, -self.config.ENEMY_HEIGHT)
         self.enemies.append(enemy)
     
@@ -245,7 +216,7 @@ class Game:
         if not self.game_over:
             # Spawn enemies
             self.enemy_timer += 1
-            if self.enemy_timer >= self.config.ENEMY_SPAWN_RATE:
+            if self.enemy_timer >= self.config.ENEMY_BASE_SPAWN_RATE:
                 self.spawn_enemy()
                 self.enemy_timer = 0
             
@@ -7,7 +7,14 @@ import pygame
 
 
 class Enemy:
-    """Enemy that falls from the top of the screen"""
+    """
+    Enemy that falls from the top of the screen.
+
+    Game keeps its enemies as bare pygame.Rect objects sharing one speed;
+    this class is the standalone per-object form of the same data.
+    """
+
+    __slots__ = ("config", "rect", "speed")
     
     def __init__(self, config, x, y, speed=None):
         """
@@ -23,21 +30,20 @@ class Enemy:
             self.config = config
             self.rect = pygame.Rect(x, y, config.ENEMY_WIDTH, config.ENEMY_HEIGHT)
             # Use provided speed or base speed from config
-            self._speed = speed if speed is not None else config.ENEMY_BASE_SPEED
+            self.speed = speed if speed is not None else config.ENEMY_BASE_SPEED
         except Exception as e:
             raise RuntimeError(f"Failed to initialize enemy: {e}")
     
-    @property
-    def speed(self):
-        """Get enemy speed"""
-        return self._speed
-    
-    @speed.setter
-    def speed(self, value):
-        """Set enemy speed with validation"""
+    def set_speed(self, value):
+        """
+        Set enemy speed with validation.
+
+        Args:
+            value: New speed in pixels per frame
+        """
         try:
             if value >= 0:
-                self._speed = value
+                self.speed = value
             else:
                 print(f"⚠️ Warning: Attempted to set negative enemy speed: {value}")
         except (TypeError, ValueError) as e:
@@ -45,10 +51,7 @@ class Enemy:
     
     def move(self):
         """Move enemy downward"""
-        try:
-            self.rect.y += self._speed
-        except Exception as e:
-            print(f"⚠️ Warning: Enemy movement error: {e}")
+        self.rect.y += self.speed
     
     def draw(self, screen):
         """
@@ -57,10 +60,7 @@ class Enemy:
         Args:
             screen: Pygame surface to draw on
         """
-        try:
-            pygame.draw.rect(screen, self.config.RED, self.rect)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw enemy: {e}")
+        pygame.draw.rect(screen, self.config.RED, self.rect)
     
     def is_off_screen(self, screen_height):
         """
@@ -72,11 +72,7 @@ class Enemy:
         Returns:
             bool: True if enemy is off screen, False otherwise
         """
-        try:
-            return self.rect.top > screen_height
-        except Exception as e:
-            print(f"⚠️ Warning: Error checking if enemy is off screen: {e}")
-            return False
+        return self.rect.top > screen_height
     
     def collides_with(self, player):
         """
@@ -88,16 +84,8 @@ class Enemy:
         Returns:
             bool: True if collision detected, False otherwise
         """
-        try:
-            return self.rect.colliderect(player.rect)
-        except Exception as e:
-            print(f"⚠️ Warning: Error checking collision: {e}")
-            return False
+        return self.rect.colliderect(player.rect)
     
     def get_position(self):
         """Get current enemy position"""
-        try:
-            return (self.rect.x, self.rect.y)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to get enemy position: {e}")
-            return (0, 0)
+        return (self.rect.x, self.rect.y)
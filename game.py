@@ -5,28 +5,74 @@ Manages the game loop, state, and coordinates all game elements.
 
 import pygame
 import random
-import sys
 import traceback
 
-from config import Config
+from config import CONFIG
 from player import Player
-from enemy import Enemy
 from spawn_manager import SpawnManager
 from power_up import PowerUp, ActivePowerUp
 
+# Key codes bound at module level so handle_input() reads them as plain globals
+K_r = pygame.K_r
+K_q = pygame.K_q
+
+# Window events after which the whole screen has to be drawn and presented again
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
 
 class Game:
     """Main game controller managing game state and loop"""
+
+    __slots__ = (
+        # Configuration and pygame resources
+        "config", "_width", "_height", "_background", "_burst_level",
+        "screen", "clock", "font", "small_font", "tiny_font", "_enemy_surface",
+        "_score_label", "_digit_surfaces",
+        # Game state
+        "_running", "_step_count", "_score", "game_over", "enemy_timer", "_lives",
+        "_difficulty_level", "_next_level_score", "_current_enemy_speed",
+        # Game objects
+        "spawn_manager", "player", "enemy_rects", "_enemy_pool", "_enemy_speed",
+        "power_ups", "_power_up_pool", "active_power_ups", "_active_power_up_pool", "_activate_handlers", "_deactivate_handlers",
+        "_original_player_speed", "_original_enemy_speed", "_slow_motions",
+        # Rendering caches and dirty-rect tracking
+        "_score_cache", "_difficulty_cache", "_spawn_info_cache", "_lives_cache",
+        "_power_up_text_cache", "_pattern_cache", "_hud_cache", "_game_over_cache",
+        "_drawn_rects", "_dirty_rects", "_game_over_shown",
+    )
     
     def __init__(self):
         """Initialize the game with configuration and game objects"""
         try:
-            self.config = Config()
+            self.config = CONFIG
+
+            # Settings read every frame, copied out of config once
+            self._width = self.config.WIDTH
+            self._height = self.config.HEIGHT
+            self._background = self.config.BLACK
+            self._burst_level = self.config.BURST_ACTIVATION_LEVEL
             
             # Initialize pygame display
             try:
+                # Plain window surface, no SCALED/OPENGL renderer: through
+                # the renderer pygame.display.update(rects) presents the whole
+                # window, which would undo the dirty-rect presents in present().
+                # Vsync needs that renderer, so pacing comes from the frame cap.
                 self.screen = pygame.display.set_mode((self.config.WIDTH, self.config.HEIGHT))
                 pygame.display.set_caption("Dodge the Blocks")
+
+                # Only queue the events the game reacts to; movement is read
+                # from pygame.key.get_pressed(), so mouse motion and other
+                # events would just be turned into objects and discarded.
+                # Expose/restore events stay allowed so run() can repaint a
+                # window whose contents the system discarded.
+                pygame.event.set_blocked(None)
+                pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP] + list(REDRAW_EVENTS))
+
+                # Pre-rendered enemy block in the display's pixel format so
+                # drawing enemies is a plain blit rather than a fill per rect
+                self._enemy_surface = pygame.Surface((self.config.ENEMY_WIDTH, self.config.ENEMY_HEIGHT)).convert()
+                self._enemy_surface.fill(self.config.RED)
             except pygame.error as e:
                 raise RuntimeError(f"Failed to create display: {e}")
             
@@ -36,17 +82,30 @@ class Game:
                 self.font = pygame.font.SysFont(None, 36)
                 if not self.font:
                     raise RuntimeError("Failed to create font")
+                self.small_font = pygame.font.SysFont(None, 24)  # Secondary HUD text
+                self.tiny_font = pygame.font.SysFont(None, 20)  # Active power-up list
+
+                # Glyph atlas for the score: the label and each digit are
+                # rasterized once and composed whenever the score changes
+                self._score_label = self.font.render("Score: ", True, self.config.WHITE).convert_alpha()
+                self._digit_surfaces = [
+                    self.font.render(str(digit), True, self.config.WHITE).convert_alpha()
+                    for digit in range(10)
+                ]
             except Exception as e:
                 raise RuntimeError(f"Failed to initialize pygame components: {e}")
             
             # Game state
+            self._running = False  # Main loop keeps going while this is set
+            self._step_count = 0  # Logic steps run so far; power-up timers expire against it
             self._score = 0
-            self._game_over = False
-            self._enemy_timer = 0
+            self.game_over = False
+            self.enemy_timer = 0  # Logic steps since the last enemy spawn
             self._lives = self.config.PLAYER_STARTING_LIVES
 
             # Difficulty scaling state
             self._difficulty_level = self.config.INITIAL_DIFFICULTY_LEVEL
+            self._refresh_next_level_score()
             self._current_enemy_speed = self.config.ENEMY_BASE_SPEED
             
             # Initialize spawn manager
@@ -65,13 +124,59 @@ class Game:
             except Exception as e:
                 raise RuntimeError(f"Failed to create player: {e}")
 
-            self.enemies = []
+            # Enemies are stored as a structure of arrays: one Rect per enemy
+            # plus a single shared fall speed, so the per-frame update works
+            # on plain Rects instead of dispatching through Enemy objects
+            self.enemy_rects = []
+            self._enemy_pool = []  # Retired enemy rects, reused by spawn_enemy
+            self._enemy_speed = self._current_enemy_speed
             self.power_ups = []  # List of active power-ups in the game world
+            self._power_up_pool = []  # Collected or missed power-ups, reused by spawn_power_up
             self.active_power_ups = []  # List of currently active power-up effects
+            # Expired effects, reused by _track_power_up (never holds more than
+            # the most effects that were ever active at once)
+            self._active_power_up_pool = []
 
             # Baseline speeds for restoring after power-up effects
             self._original_player_speed = self.player.speed
             self._original_enemy_speed = self._current_enemy_speed
+            self._slow_motions = 0  # Slow-motion effects currently active
+
+            # Power-up effect handlers indexed by PowerUpKind (extra lives
+            # are instant, so there is nothing to undo when one expires)
+            self._activate_handlers = (
+                self._activate_speed_boost,   # PowerUpKind.SPEED_BOOST
+                self._activate_slow_motion,   # PowerUpKind.SLOW_MOTION
+                self._activate_extra_life,    # PowerUpKind.EXTRA_LIFE
+                self._activate_shield,        # PowerUpKind.SHIELD
+            )
+            self._deactivate_handlers = (
+                self._deactivate_speed_boost,
+                self._deactivate_slow_motion,
+                None,
+                self._deactivate_shield,
+            )
+
+            # Rendered HUD text cached as (key, surfaces) so fonts are only
+            # rasterized when the displayed values change
+            self._score_cache = (-1, None)
+            self._difficulty_cache = (None, None)
+            self._spawn_info_cache = (None, None)
+            self._lives_cache = (None, None)
+            # Active power-up lines keyed by (type, time left); bounded by the
+            # number of types times the whole seconds in a power-up's duration
+            self._power_up_text_cache = {}
+            self._pattern_cache = (None, None)
+            # The whole HUD column, composed from the pieces above and keyed
+            # by every value it shows
+            self._hud_cache = (None, None)
+            self._game_over_cache = (None, None)
+
+            # Dirty-rect rendering: regions drawn last frame (None forces a
+            # full clear) and the regions to push to the display this frame
+            self._drawn_rects = None
+            self._dirty_rects = None
+            self._game_over_shown = False  # Game-over screen is already on display
             
         except Exception as e:
             print(f"❌ Failed to initialize game: {e}")
@@ -85,47 +190,16 @@ class Game:
     @score.setter
     def score(self, value):
         """Set score with validation"""
-        try:
-            if value >= 0:
-                self._score = value
-                # Check if difficulty should increase
+        if value >= 0:
+            self._score = value
+            # Difficulty and spawn pattern only change at known thresholds
+            if value >= self._next_level_score:
                 self._check_difficulty_increase()
-                # Update spawn pattern
-                self.spawn_manager.update_pattern(self._score)
-            else:
-                print(f"⚠️ Warning: Attempted to set negative score: {value}")
-        except (TypeError, ValueError) as e:
-            print(f"⚠️ Warning: Invalid score value: {value}, error: {e}")
+            if value >= self.spawn_manager.next_pattern_score:
+                self.spawn_manager.update_pattern(value)
+        else:
+            print(f"⚠️ Warning: Attempted to set negative score: {value}")
     
-    @property
-    def game_over(self):
-        """Get game over state"""
-        return self._game_over
-    
-    @game_over.setter
-    def game_over(self, value):
-        """Set game over state"""
-        try:
-            self._game_over = bool(value)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to set game over state: {e}")
-    
-    @property
-    def enemy_timer(self):
-        """Get enemy spawn timer"""
-        return self._enemy_timer
-
-    @enemy_timer.setter
-    def enemy_timer(self, value):
-        """Set enemy spawn timer"""
-        try:
-            if value >= 0:
-                self._enemy_timer = value
-            else:
-                print(f"⚠️ Warning: Attempted to set negative timer: {value}")
-        except (TypeError, ValueError) as e:
-            print(f"⚠️ Warning: Invalid timer value: {value}, error: {e}")
-
     @property
     def lives(self):
         """Get current lives"""
@@ -134,17 +208,14 @@ class Game:
     @lives.setter
     def lives(self, value):
         """Set lives with validation"""
-        try:
-            if value >= 0:
-                self._lives = value
-                # Check if game should end when lives reach zero
-                if self._lives == 0:
-                    self.game_over = True
-                    print("💔 Game Over! No lives remaining.")
-            else:
-                print(f"⚠️ Warning: Attempted to set negative lives: {value}")
-        except (TypeError, ValueError) as e:
-            print(f"⚠️ Warning: Invalid lives value: {value}, error: {e}")
+        if value >= 0:
+            self._lives = value
+            # Check if game should end when lives reach zero
+            if self._lives == 0:
+                self.game_over = True
+                print("💔 Game Over! No lives remaining.")
+        else:
+            print(f"⚠️ Warning: Attempted to set negative lives: {value}")
 
     @property
     def difficulty_level(self):
@@ -158,24 +229,18 @@ class Game:
     
     def _check_difficulty_increase(self):
         """Check if difficulty should increase based on score"""
-        if not self.config.DIFFICULTY_SCALING_ENABLED:
+        # Nothing to do until the score reaches the next level's threshold
+        if self._score < self._next_level_score or not self.config.DIFFICULTY_SCALING_ENABLED:
             return
             
         try:
             # Find the highest level the player has reached based on score
-            new_level = 1
-            for level, required_score in self.config.DIFFICULTY_PROGRESSION.items():
-                if self._score >= required_score:
-                    new_level = level
-                else:
-                    break
-            
-            # Cap difficulty at maximum level
-            new_level = min(new_level, self.config.MAX_DIFFICULTY_LEVEL)
+            new_level = self.config.level_for_score(self._score)
             
             # If difficulty increased, update game parameters
             if new_level > self._difficulty_level:
                 self._difficulty_level = new_level
+                self._refresh_next_level_score()
                 self._update_difficulty_parameters()
                 print(f"🎯 Difficulty increased to level {self._difficulty_level}!")
                 print(f"📊 Next level requires {self._get_next_level_requirement()} points")
@@ -183,12 +248,19 @@ class Game:
         except Exception as e:
             print(f"⚠️ Warning: Error updating difficulty: {e}")
     
+    def _refresh_next_level_score(self):
+        """Cache the score at which the difficulty level next changes"""
+        next_level_score = None
+        if self._difficulty_level < self.config.MAX_DIFFICULTY_LEVEL:
+            next_level_score = self.config.score_for_level(self._difficulty_level + 1)
+        self._next_level_score = float("inf") if next_level_score is None else next_level_score
+
     def _get_next_level_requirement(self):
         """Get the score requirement for the next level"""
         try:
-            next_level = self._difficulty_level + 1
-            if next_level in self.config.DIFFICULTY_PROGRESSION:
-                return self.config.DIFFICULTY_PROGRESSION[next_level]
+            next_level_score = self.config.score_for_level(self._difficulty_level + 1)
+            if next_level_score is not None:
+                return next_level_score
             else:
                 return "MAX LEVEL"
         except:
@@ -204,9 +276,9 @@ class Game:
             # Update spawn manager with new difficulty
             self.spawn_manager.update_spawn_rate(self._difficulty_level)
             
-            # Update existing enemies to new speed
-            for enemy in self.enemies:
-                enemy.speed = self._current_enemy_speed
+            # Update existing enemies to new speed, still slowed if a
+            # slow motion is active
+            self._apply_enemy_speed()
             
             # Keep baseline enemy speed in sync with current difficulty
             self._original_enemy_speed = self._current_enemy_speed
@@ -222,143 +294,175 @@ class Game:
             count: Number of enemies to spawn
             pattern_type: Specific spawn pattern to use
         """
-        try:
-            # Get spawn positions from spawn manager
-            positions = self.spawn_manager.get_spawn_positions(count, pattern_type)
-            
-            # Create enemies at the positions
-            for x, y in positions:
-                enemy = Enemy(self.config, x, y, self._current_enemy_speed)
-                self.enemies.append(enemy)
-                
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to spawn enemies: {e}")
+        # Get spawn positions from spawn manager
+        positions = self.spawn_manager.get_spawn_positions(count, pattern_type)
+        
+        # Place enemy rects at the positions, reusing retired ones first
+        width = self.config.ENEMY_WIDTH
+        height = self.config.ENEMY_HEIGHT
+        rects = self.enemy_rects
+        pool = self._enemy_pool
+        for x, y in positions:
+            if pool:
+                rect = pool.pop()
+                rect.topleft = (x, y)
+            else:
+                rect = pygame.Rect(x, y, width, height)
+            rects.append(rect)
 
     def spawn_burst(self):
         """Spawn a burst of enemies"""
-        try:
-            if self.spawn_manager.should_spawn_burst(self._score):
-                print(f"💥 Burst spawning {self.config.BURST_SPAWN_COUNT} enemies!")
-                self.spawn_enemy(self.config.BURST_SPAWN_COUNT, "clustered")
-
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to spawn burst: {e}")
+        if self.spawn_manager.should_spawn_burst(self._score):
+            print(f"💥 Burst spawning {self.config.BURST_SPAWN_COUNT} enemies!")
+            self.spawn_enemy(self.config.BURST_SPAWN_COUNT, "clustered")
 
     def spawn_power_up(self):
         """Spawn a power-up with random chance"""
-        try:
-            if random.random() < self.config.POWER_UP_SPAWN_CHANCE:
+        if random.random() < self.config.POWER_UP_SPAWN_CHANCE:
+            pool = self._power_up_pool
+            if pool:
+                power_up = pool.pop()
+                power_up.reset()
+            else:
                 power_up = PowerUp(self.config)
-                self.power_ups.append(power_up)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to spawn power-up: {e}")
+            self.power_ups.append(power_up)
 
 
 
     def update_power_ups(self):
         """Update power-ups and check for collection"""
-        try:
-            for power_up in self.power_ups[:]:
-                try:
-                    power_up.move()
-
-                    # Check collision with player
-                    if power_up.collides_with(self.player):
-                        # Activate power-up effect
-                        self._activate_power_up(power_up)
-                        self.power_ups.remove(power_up)
-                        continue
-
-                    # Remove power-ups that are off screen
-                    if power_up.is_off_screen():
-                        self.power_ups.remove(power_up)
-
-                except Exception as e:
-                    print(f"⚠️ Warning: Error updating power-up: {e}")
-                    # Remove problematic power-up
-                    try:
-                        self.power_ups.remove(power_up)
-                    except:
-                        pass
+        if not self.power_ups:
+            return
 
-        except Exception as e:
-            print(f"⚠️ Warning: Error in power-up update loop: {e}")
+        # Rebuild the list in one pass instead of copying it and removing
+        # collected or off-screen power-ups one by one. Moving, collision and
+        # the off-screen test work on the rects directly (the same checks as
+        # PowerUp.move, collides_with and is_off_screen) so each power-up
+        # costs no method calls.
+        survivors = []
+        pool = self._power_up_pool
+        player_rect = self.player.rect
+        screen_height = self._height
+        fall_speed = PowerUp.FALL_SPEED
+        for power_up in self.power_ups:
+            rect = power_up.rect
+            rect.move_ip(0, fall_speed)
+
+            # Check collision with player
+            if rect.colliderect(player_rect):
+                # Activate power-up effect
+                self._activate_power_up(power_up)
+                pool.append(power_up)
+                continue
+
+            # Keep power-ups that are still on screen
+            if rect.top <= screen_height:
+                survivors.append(power_up)
+            else:
+                pool.append(power_up)
+        self.power_ups = survivors
 
     def _activate_power_up(self, power_up):
         """Activate a power-up effect"""
         try:
-            effect_type = power_up.properties.get("effect", "")
-            duration = self.config.POWER_UP_DURATION
-
-            if effect_type == "player_speed":
-                # Speed boost for player
-                self.player.speed = self.player.speed + 2
-                # Create active power-up to track duration
-                active_power_up = ActivePowerUp("speed_boost", duration)
-                self.active_power_ups.append(active_power_up)
-                print(f"⚡ Speed Boost activated! Player speed increased.")
-
-            elif effect_type == "slow_motion":
-                # Slow down enemies
-                for enemy in self.enemies:
-                    enemy.speed = max(1, enemy.speed - 2)  # Slow down but not stop
-                # Create active power-up
-                active_power_up = ActivePowerUp("slow_motion", duration)
-                self.active_power_ups.append(active_power_up)
-                print(f"🐢 Slow Motion activated! Enemies slowed down.")
-
-            elif effect_type == "extra_life":
-                # Give extra life
-                self.lives += 1
-                print(f"❤️ Extra Life! Lives increased to {self.lives}.")
-
-            elif effect_type == "shield":
-                # Temporary invincibility
-                self.player.make_invincible()
-                active_power_up = ActivePowerUp("shield", duration)
-                self.active_power_ups.append(active_power_up)
-                print(f"🛡️ Shield activated! Temporary invincibility.")
-
-            else:
-                print(f"⚠️ Unknown power-up effect: {effect_type}")
-
+            if power_up.kind is None:
+                print(f"⚠️ Unknown power-up effect: {power_up.properties.get('effect', '')}")
+                return
+            self._activate_handlers[power_up.kind](power_up)
         except Exception as e:
             print(f"⚠️ Warning: Failed to activate power-up: {e}")
 
+    def _track_power_up(self, power_up):
+        """Start the on-screen timer for a collected power-up"""
+        pool = self._active_power_up_pool
+        if pool:
+            active_power_up = pool.pop()
+            active_power_up.restart(power_up.power_type, self.config.POWER_UP_DURATION, power_up.kind, self._step_count)
+        else:
+            active_power_up = ActivePowerUp(
+                power_up.power_type, self.config.POWER_UP_DURATION, power_up.kind, self._step_count
+            )
+        self.active_power_ups.append(active_power_up)
+
+    def _activate_speed_boost(self, power_up):
+        """Speed boost for player"""
+        self.player.set_speed(self.player.speed + 2)
+        self._track_power_up(power_up)
+        print(f"⚡ Speed Boost activated! Player speed increased.")
+
+    def _activate_slow_motion(self, power_up):
+        """Slow down enemies"""
+        self._slow_motions += 1
+        self._apply_enemy_speed()
+        self._track_power_up(power_up)
+        print(f"🐢 Slow Motion activated! Enemies slowed down.")
+
+    def _activate_extra_life(self, power_up):
+        """Give extra life"""
+        self.lives += 1
+        print(f"❤️ Extra Life! Lives increased to {self.lives}.")
+
+    def _activate_shield(self, power_up):
+        """Temporary invincibility"""
+        self.player.make_invincible()
+        self._track_power_up(power_up)
+        print(f"🛡️ Shield activated! Temporary invincibility.")
+
     def update_active_power_ups(self):
         """Update active power-up effects and handle expiration"""
-        try:
-            for active_power_up in self.active_power_ups[:]:
-                active_power_up.update()
+        active = self.active_power_ups
+        if not active:
+            return
 
-                if active_power_up.is_expired():
-                    # Remove expired power-up effect
-                    self._deactivate_power_up(active_power_up)
-                    self.active_power_ups.remove(active_power_up)
-
-        except Exception as e:
-            print(f"⚠️ Warning: Error updating active power-ups: {e}")
+        # Every effect lasts POWER_UP_DURATION and they are appended as they
+        # are collected, so the expired ones always form a prefix of the list
+        step = self._step_count
+        expired = 0
+        for active_power_up in active:
+            if active_power_up.expires_at > step:
+                break
+            expired += 1
+
+        if expired:
+            # Remove expired power-up effects and keep the objects for reuse
+            for active_power_up in active[:expired]:
+                self._deactivate_power_up(active_power_up)
+            self._active_power_up_pool.extend(active[:expired])
+            del active[:expired]
 
     def _deactivate_power_up(self, active_power_up):
         """Deactivate a power-up effect"""
         try:
-            if active_power_up.power_type == "speed_boost":
-                # Restore original player speed
-                self.player.restore_speed(self._original_player_speed)
-                print(f"🏃 Speed Boost expired. Speed restored.")
+            handler = self._deactivate_handlers[active_power_up.kind]
+            if handler is not None:
+                handler()
+        except Exception as e:
+            print(f"⚠️ Warning: Error deactivating power-up: {e}")
 
-            elif active_power_up.power_type == "slow_motion":
-                # Restore original enemy speed
-                for enemy in self.enemies:
-                    enemy.speed = self._original_enemy_speed
-                print(f"💨 Slow Motion expired. Enemy speed restored.")
+    def _deactivate_speed_boost(self):
+        """Restore original player speed"""
+        self.player.restore_speed(self._original_player_speed)
+        print(f"🏃 Speed Boost expired. Speed restored.")
 
-            elif active_power_up.power_type == "shield":
-                # Invincibility will naturally expire
-                print(f"🛡️ Shield expired. Normal collision detection active.")
+    def _deactivate_slow_motion(self):
+        """Restore original enemy speed once no slow motion is left"""
+        self._slow_motions -= 1
+        self._apply_enemy_speed()
+        if self._slow_motions:
+            return
+        print(f"💨 Slow Motion expired. Enemy speed restored.")
 
-        except Exception as e:
-            print(f"⚠️ Warning: Error deactivating power-up: {e}")
+    def _deactivate_shield(self):
+        """Invincibility will naturally expire"""
+        print(f"🛡️ Shield expired. Normal collision detection active.")
+
+    def _apply_enemy_speed(self):
+        """Set the enemy speed for the current difficulty and slow motion"""
+        speed = self._current_enemy_speed
+        if self._slow_motions:
+            # Overlapping slow motions don't stack; slow down but not stop
+            speed = max(1, speed - 2)
+        self._enemy_speed = speed
 
     def _apply_power_up_game_effect(self, power_type):
         """Apply game-wide effects of power-ups"""
@@ -368,8 +472,7 @@ class Game:
                 print(f"❤️ Extra life! Lives: {self.lives}")
             elif power_type == "slow_enemies":
                 # Temporarily slow all enemies
-                for enemy in self.enemies:
-                    enemy.speed = int(enemy.speed * self.config.POWER_UP_SLOW_ENEMIES_FACTOR)
+                self._enemy_speed = int(self._enemy_speed * self.config.POWER_UP_SLOW_ENEMIES_FACTOR)
             elif power_type == "invincibility":
                 # Make player invincible
                 self.player.make_invincible()
@@ -381,95 +484,117 @@ class Game:
         try:
             if self.player.has_active_power_up("slow_enemies"):
                 # Keep enemies slowed
-                for enemy in self.enemies:
-                    target_speed = int(self._current_enemy_speed * self.config.POWER_UP_SLOW_ENEMIES_FACTOR)
-                    if enemy.speed != target_speed:
-                        enemy.speed = target_speed
+                self._enemy_speed = int(self._current_enemy_speed * self.config.POWER_UP_SLOW_ENEMIES_FACTOR)
             else:
                 # Restore normal enemy speed
-                for enemy in self.enemies:
-                    if enemy.speed != self._current_enemy_speed:
-                        enemy.speed = self._current_enemy_speed
+                self._enemy_speed = self._current_enemy_speed
         except Exception as e:
             print(f"⚠️ Warning: Error updating slow enemies effect: {e}")
     
     def update_enemies(self):
-        """Update enemy positions and check collisions"""
-        try:
-            for enemy in self.enemies[:]:
-                try:
-                    enemy.move()
-
-                    # Check collision with player (only if not invincible)
-                    if enemy.collides_with(self.player) and not self.player.is_invincible():
-                        # Lose a life and become invincible
-                        self.lives -= 1
-                        self.player.make_invincible()
-                        print(f"💔 Life lost! {self.lives} lives remaining.")
-
-                        # Remove the enemy that caused the collision
-                        try:
-                            self.enemies.remove(enemy)
-                        except:
-                            pass
-
-                        # If no lives left, game over will be triggered by lives setter
-                        if self.lives == 0:
-                            return
-                        continue
-
-                    # Remove enemies that are off screen and award points
-                    if enemy.is_off_screen(self.config.HEIGHT):
-                        self.enemies.remove(enemy)
-                        self.score += 1
-
-                except Exception as e:
-                    print(f"⚠️ Warning: Error updating enemy: {e}")
-                    # Remove problematic enemy
-                    try:
-                        self.enemies.remove(enemy)
-                    except:
-                        pass
+        """
+        Update enemy positions and check collisions.
 
-        except Exception as e:
-            print(f"⚠️ Warning: Error in enemy update loop: {e}")
+        Runs every frame, so it carries no exception handler of its own;
+        errors surface through run().
+        """
+        rects = self.enemy_rects
+        if not rects:
+            return
+
+        # Move every enemy by the shared speed
+        speed = self._enemy_speed
+        for rect in rects:
+            rect.move_ip(0, speed)
+
+        # Check collision with player (only if not invincible). A hit makes
+        # the player invincible, so only the first colliding enemy matters
+        # and collidelist can stop at it instead of collecting every hit.
+        player = self.player
+        if not player.invincibility_timer:
+            hit = player.rect.collidelist(rects)
+            if hit >= 0:
+                # Remove the enemy that caused the collision
+                self._recycle_enemies(rects[hit:hit + 1])
+                del rects[hit]
+
+                # Lose a life and become invincible
+                self.lives -= 1
+                player.make_invincible()
+                print(f"💔 Life lost! {self.lives} lives remaining.")
+
+                # If no lives left, game over will be triggered by lives setter
+                if self.lives == 0:
+                    return
+
+        # Enemies spawn at the same height and share one speed, so the list
+        # stays ordered oldest (lowest) first and the ones that left the
+        # screen always form a prefix that can be trimmed in place
+        screen_height = self._height
+        dodged = 0
+        for rect in rects:
+            if rect.top <= screen_height:
+                break
+            dodged += 1
+
+        # Award a point for each enemy dodged. The total is always positive,
+        # so skip the score setter's validation and run its follow-ups once.
+        if dodged:
+            self._recycle_enemies(rects[:dodged])
+            del rects[:dodged]
+            score = self._score + dodged
+            self._score = score
+            if score >= self._next_level_score:
+                self._check_difficulty_increase()
+            if score >= self.spawn_manager.next_pattern_score:
+                self.spawn_manager.update_pattern(score)
+
+    def _recycle_enemies(self, retired):
+        """
+        Return retired enemy rects to the pool for reuse.
+
+        Args:
+            retired: Enemy rects that are leaving play
+        """
+        pool = self._enemy_pool
+        room = self.config.ENEMY_POOL_SIZE - len(pool)
+        if room > 0:
+            pool.extend(retired[:room])
     
     def handle_input(self):
         """Handle keyboard input"""
-        try:
-            keys = pygame.key.get_pressed()
-            
-            if not self.game_over:
-                try:
-                    self.player.move(keys, self.config.WIDTH)
-                except Exception as e:
-                    print(f"⚠️ Warning: Player movement error: {e}")
-            else:
-                if keys[pygame.K_r]:
-                    self.reset_game()
-                elif keys[pygame.K_q]:
-                    pygame.quit()
-                    sys.exit()
-                    
-        except Exception as e:
-            print(f"⚠️ Warning: Input handling error: {e}")
+        keys = pygame.key.get_pressed()
+        
+        if not self.game_over:
+            self.player.move(keys, self._width)
+        else:
+            if keys[K_r]:
+                self.reset_game()
+            elif keys[K_q]:
+                self._running = False  # Loop exits; main() shuts pygame down
 
     def reset_game(self):
         """Reset game to initial state"""
         try:
             self.player.reset_position(self.config.WIDTH, self.config.HEIGHT)
-            self.enemies.clear()
-            self.power_ups.clear()  # Clear power-ups
-            if hasattr(self, 'active_power_ups'):
-                self.active_power_ups.clear()  # Clear active power-up effects
+            self._recycle_enemies(self.enemy_rects)
+            self.enemy_rects = []
+            self._power_up_pool.extend(self.power_ups)
+            self.power_ups = []  # Clear power-ups
+            self._active_power_up_pool.extend(self.active_power_ups)
+            self.active_power_ups = []  # Clear active power-up effects
             self.score = 0
             self.game_over = False
+            self._game_over_shown = False
             self.enemy_timer = 0
             self.lives = self.config.PLAYER_STARTING_LIVES  # Reset lives
 
             # Reset difficulty
             self._difficulty_level = self.config.INITIAL_DIFFICULTY_LEVEL
+            self._refresh_next_level_score()
             self._current_enemy_speed = self.config.ENEMY_BASE_SPEED
+            self._slow_motions = 0
+            self._enemy_speed = self._current_enemy_speed
 
             # Reset spawn manager
             self.spawn_manager = SpawnManager(self.config)
@@ -482,189 +607,272 @@ class Game:
         except Exception as e:
             print(f"⚠️ Warning: Failed to reset game: {e}")
     
-    def draw_score(self):
-        """Draw score on screen"""
-        try:
-            score_text = self.font.render(f"Score: {self.score}", True, self.config.WHITE)
-            self.screen.blit(score_text, self.config.SCORE_POSITION)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw score: {e}")
-    
-    def draw_difficulty(self):
-        """Draw difficulty level and progress on screen"""
+    def draw_hud(self):
+        """Draw the HUD, recomposing it only when a displayed value changes"""
+        spawn_manager = self.spawn_manager
+        step = self._step_count
+        update_rate = self.config.UPDATE_RATE
+        power_up_times = tuple(
+            (active_power_up.power_type, active_power_up.get_remaining_time_display(step, update_rate))
+            for active_power_up in self.active_power_ups
+        )
+        key = (self._score, self._difficulty_level, spawn_manager.current_spawn_rate, self._lives, power_up_times)
+        if self._hud_cache[0] != key:
+            self._hud_cache = (key, self._compose_hud(power_up_times))
+        hud_surface, hud_position = self._hud_cache[1]
+
+        screen = self.screen
+        drawn = self._drawn_rects
+        drawn.append(screen.blit(hud_surface, hud_position))
+
+        # Current pattern sits alone in the top-right corner, so it is blitted
+        # separately rather than stretching the composed surface across the screen
+        pattern_name = spawn_manager.get_current_pattern_name()
+        if self._pattern_cache[0] != pattern_name:
+            self._pattern_cache = (pattern_name, self.small_font.render(f"Pattern: {pattern_name}", True, self.config.WHITE))
+        pattern_text = self._pattern_cache[1]
+        pattern_x = self._width - pattern_text.get_width() - 10
+        drawn.append(screen.blit(pattern_text, (pattern_x, 10)))
+
+    def _compose_hud(self, power_up_times):
+        """
+        Compose the HUD text column onto a single transparent surface.
+
+        Args:
+            power_up_times: (power type, remaining time display) per active power-up
+
+        Returns:
+            tuple: (surface, screen position) of the composed HUD
+        """
+        config = self.config
+        blits = []
+
+        # Score
+        if self._score_cache[0] != self._score:
+            self._score_cache = (self._score, self._compose_score(self._score))
+        blits.append((self._score_cache[1], config.SCORE_POSITION))
+
+        # Current level and progress to the next one (smaller font)
+        key = (self._difficulty_level, self._score)
+        if self._difficulty_cache[0] != key:
+            self._difficulty_cache = (key, self._render_difficulty())
+        difficulty_text, progress_surface = self._difficulty_cache[1]
+        blits.append((difficulty_text, config.DIFFICULTY_POSITION))
+        if progress_surface is not None:
+            progress_x = config.DIFFICULTY_POSITION[0]
+            progress_y = config.DIFFICULTY_POSITION[1] + 25
+            blits.append((progress_surface, (progress_x, progress_y)))
+
+        # Spawn rate
+        spawn_rate = self.spawn_manager.get_spawn_rate_display()
+        if self._spawn_info_cache[0] != spawn_rate:
+            self._spawn_info_cache = (spawn_rate, self.font.render(f"Spawn: {spawn_rate}", True, config.WHITE))
+        blits.append((self._spawn_info_cache[1], config.SPAWN_RATE_POSITION))
+
+        # Lives
+        if self._lives_cache[0] != self._lives:
+            self._lives_cache = (self._lives, self.font.render(f"Lives: {self._lives}", True, config.WHITE))
+        blits.append((self._lives_cache[1], config.LIVES_POSITION))
+
+        # Active power-ups, one line each
+        power_up_x, y_offset = config.POWER_UP_POSITION
+        for key in power_up_times:
+            power_up_text = self._power_up_text_cache.get(key)
+            if power_up_text is None:
+                # Get power-up color from config
+                power_type, remaining = key
+                power_up_info = config.POWER_UP_TYPES.get(power_type, {})
+                color = power_up_info.get("color", config.WHITE)
+
+                # Create text with power-up name and remaining time
+                effect_name = power_type.replace("_", " ").title()
+                power_up_text = self.tiny_font.render(f"{effect_name}: {remaining}", True, color)
+                self._power_up_text_cache[key] = power_up_text
+            blits.append((power_up_text, (power_up_x, y_offset)))
+            y_offset += 22  # Move down for next power-up
+
+        bounds = pygame.Rect(config.SCORE_POSITION, (0, 0)).unionall(
+            [text.get_rect(topleft=position) for text, position in blits]
+        )
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+        # Lines never overlap, so adding onto the transparent surface copies
+        # their pixels and alpha exactly (as in _compose_score)
+        for text, (x, y) in blits:
+            surface.blit(text, (x - bounds.x, y - bounds.y), special_flags=pygame.BLEND_RGBA_ADD)
+        return surface, bounds.topleft
+
+    def _compose_score(self, score):
+        """Build the score text surface from the pre-rendered glyph atlas"""
+        glyphs = [self._score_label]
+        glyphs.extend(self._digit_surfaces[ord(char) - 48] for char in str(score))
+
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max(glyph.get_height() for glyph in glyphs)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Glyphs never overlap, so adding onto the transparent surface copies
+        # their pixels and alpha exactly (a normal blit would darken the edges)
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            x += glyph.get_width()
+        return surface
+
+    def _render_difficulty(self):
+        """Render the level and next-level progress surfaces"""
+        difficulty_text = self.font.render(f"Level: {self.difficulty_level}", True, self.config.WHITE)
+
+        progress_surface = None
         try:
-            # Current level
-            difficulty_text = self.font.render(f"Level: {self.difficulty_level}", True, self.config.WHITE)
-            self.screen.blit(difficulty_text, self.config.DIFFICULTY_POSITION)
-            
-            # Progress to next level (smaller font)
-            try:
-                small_font = pygame.font.SysFont(None, 24)
+            if self._difficulty_level < self.config.MAX_DIFFICULTY_LEVEL:
+                current_level_score = self.config.score_for_level(self._difficulty_level) or 0
+                next_level_score = self.config.score_for_level(self._difficulty_level + 1) or 0
                 
-                if self._difficulty_level < self.config.MAX_DIFFICULTY_LEVEL:
-                    current_level_score = self.config.DIFFICULTY_PROGRESSION.get(self._difficulty_level, 0)
-                    next_level_score = self.config.DIFFICULTY_PROGRESSION.get(self._difficulty_level + 1, 0)
-                    
-                    if next_level_score > current_level_score:
-                        progress = self._score - current_level_score
-                        total_needed = next_level_score - current_level_score
-                        progress_text = f"Next: {progress}/{total_needed} pts"
-                    else:
-                        progress_text = "Next: MAX LEVEL"
+                if next_level_score > current_level_score:
+                    progress = self._score - current_level_score
+                    total_needed = next_level_score - current_level_score
+                    progress_text = f"Next: {progress}/{total_needed} pts"
                 else:
-                    progress_text = "MAX LEVEL REACHED!"
-                
-                progress_surface = small_font.render(progress_text, True, self.config.WHITE)
-                progress_x = self.config.DIFFICULTY_POSITION[0]
-                progress_y = self.config.DIFFICULTY_POSITION[1] + 25
-                self.screen.blit(progress_surface, (progress_x, progress_y))
-                
-            except Exception as e:
-                print(f"⚠️ Warning: Failed to draw difficulty progress: {e}")
-                
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw difficulty: {e}")
-    
-    def draw_spawn_info(self):
-        """Draw spawn rate and pattern information"""
-        try:
-            # Spawn rate
-            spawn_rate_text = self.font.render(f"Spawn: {self.spawn_manager.get_spawn_rate_display()}", True, self.config.WHITE)
-            self.screen.blit(spawn_rate_text, self.config.SPAWN_RATE_POSITION)
+                    progress_text = "Next: MAX LEVEL"
+            else:
+                progress_text = "MAX LEVEL REACHED!"
+            
+            progress_surface = self.small_font.render(progress_text, True, self.config.WHITE)
             
-            # Current pattern (smaller font)
-            try:
-                small_font = pygame.font.SysFont(None, 24)
-                pattern_text = small_font.render(f"Pattern: {self.spawn_manager.get_current_pattern_name()}", True, self.config.WHITE)
-                pattern_x = self.config.WIDTH - pattern_text.get_width() - 10
-                self.screen.blit(pattern_text, (pattern_x, 10))
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw spawn info: {e}")
-
-    def draw_lives(self):
-        """Draw lives information on screen"""
-        try:
-            lives_text = self.font.render(f"Lives: {self.lives}", True, self.config.WHITE)
-            self.screen.blit(lives_text, self.config.LIVES_POSITION)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw lives: {e}")
-
-    def draw_active_power_ups(self):
-        """Draw active power-up information on screen"""
-        try:
-            if self.active_power_ups:
-                small_font = pygame.font.SysFont(None, 20)
-                y_offset = self.config.POWER_UP_POSITION[1]
-
-                for active_power_up in self.active_power_ups:
-                    # Get power-up color from config
-                    power_up_info = self.config.POWER_UP_TYPES.get(active_power_up.power_type, {})
-                    color = power_up_info.get("color", self.config.WHITE)
-
-                    # Create text with power-up name and remaining time
-                    effect_name = active_power_up.power_type.replace("_", " ").title()
-                    power_up_text = small_font.render(f"{effect_name}: {active_power_up.get_remaining_time_display()}", True, color)
-                    self.screen.blit(power_up_text, (self.config.POWER_UP_POSITION[0], y_offset))
-                    y_offset += 22  # Move down for next power-up
-
         except Exception as e:
-            print(f"⚠️ Warning: Failed to draw active power-ups: {e}")
+            print(f"⚠️ Warning: Failed to draw difficulty progress: {e}")
 
+        return difficulty_text, progress_surface
+    
     def draw_game_over(self):
         """Draw game over screen"""
-        try:
-            text = self.font.render("Game Over! Press R to Restart or Q to Quit", True, self.config.WHITE)
-            text_x = self.config.WIDTH // 2 - text.get_width() // 2
-            text_y = int(self.config.HEIGHT * self.config.GAME_OVER_Y_OFFSET)
-            self.screen.blit(text, (text_x, text_y))
-            
-            # Show final score and difficulty
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, self.config.WHITE)
-            final_score_x = self.config.WIDTH // 2 - final_score_text.get_width() // 2
-            final_score_y = text_y + 50
-            self.screen.blit(final_score_text, (final_score_x, final_score_y))
-            
-            final_level_text = self.font.render(f"Final Level: {self.difficulty_level}", True, self.config.WHITE)
-            final_level_x = self.config.WIDTH // 2 - final_level_text.get_width() // 2
-            final_level_y = final_score_y + 40
-            self.screen.blit(final_level_text, (final_level_x, final_level_y))
-            
-            # Show final spawn pattern
-            final_pattern_text = self.font.render(f"Final Pattern: {self.spawn_manager.get_current_pattern_name()}", True, self.config.WHITE)
-            final_pattern_x = self.config.WIDTH // 2 - final_pattern_text.get_width() // 2
-            final_pattern_y = final_level_y + 40
-            self.screen.blit(final_pattern_text, (final_pattern_x, final_pattern_y))
-            
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw game over screen: {e}")
+        key = (self._score, self._difficulty_level, self.spawn_manager.get_current_pattern_name())
+        if self._game_over_cache[0] != key:
+            self._game_over_cache = (key, self._render_game_over())
+        for surface, position in self._game_over_cache[1]:
+            self._drawn_rects.append(self.screen.blit(surface, position))
+
+    def _render_game_over(self):
+        """Render the game over text as a list of (surface, position) pairs"""
+        blits = []
+
+        text = self.font.render("Game Over! Press R to Restart or Q to Quit", True, self.config.WHITE)
+        text_x = self.config.WIDTH // 2 - text.get_width() // 2
+        text_y = int(self.config.HEIGHT * self.config.GAME_OVER_Y_OFFSET)
+        blits.append((text, (text_x, text_y)))
+        
+        # Show final score and difficulty
+        final_score_text = self.font.render(f"Final Score: {self.score}", True, self.config.WHITE)
+        final_score_x = self.config.WIDTH // 2 - final_score_text.get_width() // 2
+        final_score_y = text_y + 50
+        blits.append((final_score_text, (final_score_x, final_score_y)))
+        
+        final_level_text = self.font.render(f"Final Level: {self.difficulty_level}", True, self.config.WHITE)
+        final_level_x = self.config.WIDTH // 2 - final_level_text.get_width() // 2
+        final_level_y = final_score_y + 40
+        blits.append((final_level_text, (final_level_x, final_level_y)))
+        
+        # Show final spawn pattern
+        final_pattern_text = self.font.render(f"Final Pattern: {self.spawn_manager.get_current_pattern_name()}", True, self.config.WHITE)
+        final_pattern_x = self.config.WIDTH // 2 - final_pattern_text.get_width() // 2
+        final_pattern_y = final_level_y + 40
+        blits.append((final_pattern_text, (final_pattern_x, final_pattern_y)))
+
+        return blits
     
     def draw(self):
-        """Draw all game elements"""
+        """Draw all game elements, tracking the screen regions that changed"""
+        if self._game_over_shown:
+            # The game-over screen is static: nothing to redraw or present
+            self._dirty_rects = []
+            return
+
         try:
-            self.screen.fill(self.config.BLACK)
+            # Erase only what was drawn last frame instead of the whole screen
+            screen = self.screen
+            previous = self._drawn_rects
+            if previous is None:
+                screen.fill(self._background)
+            else:
+                fill = screen.fill
+                background = self._background
+                for rect in previous:
+                    fill(background, rect)
+            self._drawn_rects = drawn = []
             
             if not self.game_over:
                 # Draw game elements
-                try:
-                    self.player.draw(self.screen)
-                except Exception as e:
-                    print(f"⚠️ Warning: Failed to draw player: {e}")
+                player = self.player
+                player.draw(screen)
+                drawn.append(player.rect.copy())
                     
-                for enemy in self.enemies:
-                    try:
-                        enemy.draw(self.screen)
-                    except Exception as e:
-                        print(f"⚠️ Warning: Failed to draw enemy: {e}")
-
-                # Draw power-ups
-                for power_up in self.power_ups:
-                    try:
-                        power_up.draw(self.screen)
-                    except Exception as e:
-                        print(f"⚠️ Warning: Failed to draw power-up: {e}")
-
-                self.draw_score()
-                self.draw_difficulty()
-                self.draw_spawn_info()
-                self.draw_lives()
-                self.draw_active_power_ups()
+                # Draw all enemies with one batched blit call
+                enemy_surface = self._enemy_surface
+                drawn.extend(screen.blits([(enemy_surface, rect) for rect in self.enemy_rects]))
+
+                # Draw power-ups, batched the same way from their shared
+                # pre-rendered squares
+                power_ups = self.power_ups
+                if power_ups:
+                    drawn.extend(screen.blits([(power_up.surface, power_up.rect) for power_up in power_ups]))
+
+                self.draw_hud()
             else:
                 self.draw_game_over()
+                self._game_over_shown = True
+
+            # Changed regions are the erased ones plus everything drawn now
+            self._dirty_rects = None if previous is None else previous + drawn
                 
         except Exception as e:
+            # Fall back to a full redraw next frame
+            self._drawn_rects = None
+            self._dirty_rects = None
             print(f"⚠️ Warning: Drawing error: {e}")
+
+    def present(self):
+        """
+        Push this frame's changed regions (or the whole screen) to the display.
+
+        Partial presents only save work on a plain window surface; with the
+        SCALED or OPENGL flags pygame presents the full window on every update.
+        """
+        if self._dirty_rects is None:
+            pygame.display.flip()
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
     
     def update(self):
         """Update game logic"""
-        try:
-            if not self.game_over:
-                # Spawn enemies using spawn manager
-                self.enemy_timer += 1
-                if self.spawn_manager.should_spawn_enemy(self.enemy_timer):
-                    self.spawn_enemy(1)  # Spawn single enemy
-                    self.enemy_timer = 0
-
-                # Check for burst spawning
-                if self.difficulty_level >= self.config.BURST_ACTIVATION_LEVEL:
-                    self.spawn_burst()
-
-                # Spawn power-ups randomly
-                self.spawn_power_up()
-
-                # Update enemies
-                self.update_enemies()
-
-                # Update power-ups
-                self.update_power_ups()
-
-                # Update active power-up effects
-                self.update_active_power_ups()
-
-        except Exception as e:
-            print(f"⚠️ Warning: Game update error: {e}")
+        if not self.game_over:
+            self._step_count += 1
+
+            # Spawn enemies at the spawn manager's current rate. run() calls
+            # this once per fixed-length logic step, so counting steps keeps
+            # the spawn rate tied to real time even when rendering falls behind.
+            timer = self.enemy_timer + 1
+            spawn_rate = self.spawn_manager.current_spawn_rate
+            if timer >= spawn_rate:
+                self.spawn_enemy(1)  # Spawn single enemy
+                timer -= spawn_rate
+            self.enemy_timer = timer
+
+            # Check for burst spawning
+            if self._difficulty_level >= self._burst_level:
+                self.spawn_burst()
+
+            # Spawn power-ups randomly
+            self.spawn_power_up()
+
+            # Update enemies
+            self.update_enemies()
+
+            # Update power-ups
+            self.update_power_ups()
+
+            # Update active power-up effects
+            self.update_active_power_ups()
     
     def run(self):
         """Main game loop"""
@@ -672,36 +880,76 @@ class Game:
         print(f"🎯 Initial difficulty level: {self.difficulty_level}")
         print(f"🔄 Initial spawn pattern: {self.spawn_manager.get_current_pattern_name()}")
         
+        # Bind everything the loop touches each frame to locals once
+        event_get = pygame.event.get
+        event_clear = pygame.event.clear
+        QUIT = pygame.QUIT
+        handle_input = self.handle_input
+        update = self.update
+        update_invincibility = self.player.update_invincibility
+        draw = self.draw
+        present = self.present
+        tick = self.clock.tick
+        fps = self.config.FPS
+        idle_fps = self.config.IDLE_FPS
+
+        # Game logic advances in fixed-length steps; pending_ms is how far
+        # the steps run so far lag behind real time
+        step_ms = 1000 / self.config.UPDATE_RATE
+        max_steps = self.config.MAX_CATCHUP_STEPS
+        pending_ms = 0.0
+        tick(fps)  # Start timing from here rather than from Game creation
+        
+        self._running = True
         try:
-            while True:
-                try:
-                    # Event handling
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            print("👋 Game closed by user")
-                            return
-                    
+            while self._running:
+                # Event handling: QUIT ends the loop, window expose/restore
+                # events force a full repaint, and the rest are dropped
+                if event_get(QUIT):
+                    print("👋 Game closed by user")
+                    self._running = False
+                    break
+                if event_get(REDRAW_EVENTS):
+                    # The window was exposed or restored: repaint everything,
+                    # including a game-over screen that is otherwise static
+                    self._game_over_shown = False
+                    self._drawn_rects = None
+                event_clear()
+
+                # One logic step per rendered frame, so every frame shows new
+                # positions. Extra steps only run once rendering has fallen a
+                # whole step behind; after a long stall, drop what's left over
+                # rather than fast-forwarding.
+                steps = 0
+                while True:
                     # Handle input
-                    self.handle_input()
+                    handle_input()
 
                     # Update game state
-                    self.update()
+                    update()
 
                     # Update player invincibility
-                    self.player.update_invincibility()
-
-                    # Draw everything
-                    self.draw()
-                    
-                    # Update display
-                    pygame.display.flip()
-                    self.clock.tick(self.config.FPS)
-                    
-                except Exception as e:
-                    print(f"⚠️ Warning: Error in game loop iteration: {e}")
-                    # Continue running the game loop
-                    continue
-                    
+                    update_invincibility()
+
+                    pending_ms -= step_ms
+                    steps += 1
+                    if pending_ms < step_ms:
+                        break
+                    if steps == max_steps:
+                        pending_ms = 0.0
+                        break
+                if pending_ms < 0.0:
+                    # Frames shorter than a step don't bank time for later
+                    pending_ms = 0.0
+
+                # Draw everything
+                draw()
+                
+                # Update display
+                present()
+                # Throttle while only the game-over screen is waiting for a key
+                pending_ms += tick(idle_fps if self.game_over else fps)
+                
         except KeyboardInterrupt:
             print("\n⏹️ Game interrupted by user")
         except Exception as e:
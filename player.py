@@ -5,9 +5,19 @@ Handles player movement, drawing, and state management.
 
 import pygame
 
+# Key codes bound at module level so move() reads them as plain globals
+K_LEFT = pygame.K_LEFT
+K_RIGHT = pygame.K_RIGHT
+
 
 class Player:
     """Player character that can move left and right"""
+
+    __slots__ = (
+        "config", "rect", "speed", "invincibility_timer",
+        "_surface", "_invincible_surface", "_flash_surfaces",
+        "active_power_ups", "_expired_buf", "base_speed", "speed_boost_multiplier",
+    )
     
     def __init__(self, config, x, y):
         """
@@ -21,27 +31,39 @@ class Player:
         try:
             self.config = config
             self.rect = pygame.Rect(x, y, config.PLAYER_WIDTH, config.PLAYER_HEIGHT)
-            self._speed = config.PLAYER_SPEED
+            self.speed = config.PLAYER_SPEED
             self.invincibility_timer = 0  # Timer for invincibility after losing a life
 
+            # Pre-rendered player blocks (requires the display mode to be set)
+            self._surface = pygame.Surface(self.rect.size).convert()
+            self._surface.fill(config.BLUE)
+            self._invincible_surface = pygame.Surface(self.rect.size).convert()
+            self._invincible_surface.fill((0, 255, 255))  # Cyan color
+            # Invincibility flash indexed by invincibility_timer % 20: cyan for
+            # ten frames, then the normal block for ten
+            self._flash_surfaces = (self._invincible_surface,) * 10 + (self._surface,) * 10
+
             # Power-up state
             self.active_power_ups = {}  # Dict of power_up_type -> remaining_duration
+            self._expired_buf = []  # Reused by update_power_ups for expired types
             self.base_speed = config.PLAYER_SPEED  # Store original speed
             self.speed_boost_multiplier = 1.0  # Current speed multiplier
         except Exception as e:
             raise RuntimeError(f"Failed to initialize player: {e}")
         
-    @property
-    def speed(self):
-        """Get player speed"""
-        return self._speed
-    
-    @speed.setter
-    def speed(self, value):
-        """Set player speed with validation"""
+    def set_speed(self, value):
+        """
+        Set player speed with validation.
+
+        move() reads the plain speed attribute every frame, so validation
+        lives here for callers changing speed from outside the class.
+
+        Args:
+            value: New speed in pixels per frame
+        """
         try:
             if value >= 0:
-                self._speed = value
+                self.speed = value
             else:
                 print(f"⚠️ Warning: Attempted to set negative player speed: {value}")
         except (TypeError, ValueError) as e:
@@ -55,13 +77,19 @@ class Player:
             keys: Pygame key state
             screen_width: Width of the game screen
         """
-        try:
-            if keys[pygame.K_LEFT] and self.rect.left > 0:
-                self.rect.x -= self._speed
-            if keys[pygame.K_RIGHT] and self.rect.right < screen_width:
-                self.rect.x += self._speed
-        except Exception as e:
-            print(f"⚠️ Warning: Player movement error: {e}")
+        # Signed step: +speed for right, -speed for left, 0 for both/neither
+        dx = (keys[K_RIGHT] - keys[K_LEFT]) * self.speed
+        if dx:
+            rect = self.rect
+            new_x = rect.x + dx
+            max_x = screen_width - rect.width
+
+            # Clamp to the screen edges
+            if new_x < 0:
+                new_x = 0
+            elif new_x > max_x:
+                new_x = max_x
+            rect.x = new_x
     
     def draw(self, screen):
         """
@@ -70,14 +98,9 @@ class Player:
         Args:
             screen: Pygame surface to draw on
         """
-        try:
-            # Draw invincible effect if active, otherwise normal player
-            if self.is_invincible():
-                self.draw_invincible_effect(screen)
-            else:
-                pygame.draw.rect(screen, self.config.BLUE, self.rect)
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to draw player: {e}")
+        # Flash while invincible, otherwise the normal player block
+        timer = self.invincibility_timer
+        screen.blit(self._flash_surfaces[timer % 20] if timer else self._surface, self.rect)
     
     def reset_position(self, screen_width, screen_height):
         """
@@ -130,79 +153,74 @@ class Player:
         if self.invincibility_timer > 0:
             self.invincibility_timer -= 1
 
-    def activate_power_up(self, power_up):
+    def activate_power_up(self, power_up, duration=None):
         """
         Activate a power-up effect on the player.
 
         Args:
             power_up: PowerUp object that was collected
+            duration: Effect duration in frames (POWER_UP_DURATION if None)
         """
         try:
             power_type = power_up.power_type
-            duration = power_up.get_effect_duration()
+            if duration is None:
+                duration = self.config.POWER_UP_DURATION
 
             # Add or extend power-up duration
-            if power_type in self.active_power_ups:
-                self.active_power_ups[power_type] = max(self.active_power_ups[power_type], duration)
-            else:
-                self.active_power_ups[power_type] = duration
+            self.active_power_ups[power_type] = max(self.active_power_ups.get(power_type, 0), duration)
 
             # Apply immediate effects
-            self._apply_power_up_effect(power_type)
+            self._apply_power_up_effect(power_type, duration)
 
             print(f"⚡ Power-up activated: {power_up.get_effect_description()}")
 
         except Exception as e:
             print(f"⚠️ Warning: Failed to activate power-up: {e}")
 
-    def _apply_power_up_effect(self, power_type):
+    def _apply_power_up_effect(self, power_type, duration):
         """Apply the effect of a specific power-up type"""
         try:
             if power_type == "speed_boost":
                 self.speed_boost_multiplier = self.config.POWER_UP_SPEED_BOOST_MULTIPLIER
-                self._speed = int(self.base_speed * self.speed_boost_multiplier)
-            elif power_type == "slow_enemies":
-                # This will be handled by the game class
-                pass
-            elif power_type == "invincibility":
-                # This will be handled by the game class
-                pass
-            elif power_type == "score_multiplier":
-                # This will be handled by the game class
-                pass
+                self.speed = int(self.base_speed * self.speed_boost_multiplier)
+            elif power_type == "shield":
+                # Temporary invincibility, extended to cover the whole duration
+                self.invincibility_timer = max(self.invincibility_timer, duration)
+            # Slow motion and extra lives are handled by the game class
         except Exception as e:
             print(f"⚠️ Warning: Failed to apply power-up effect: {e}")
 
     def update_power_ups(self):
         """Update all active power-ups (call this every frame)"""
-        try:
-            # Update durations and remove expired power-ups
-            expired_power_ups = []
-            for power_type, duration in self.active_power_ups.items():
-                self.active_power_ups[power_type] = duration - 1
-                if self.active_power_ups[power_type] <= 0:
-                    expired_power_ups.append(power_type)
-
-            # Remove expired power-ups
-            for power_type in expired_power_ups:
-                del self.active_power_ups[power_type]
-                self._remove_power_up_effect(power_type)
-                print(f"⏰ Power-up expired: {power_type.replace('_', ' ').title()}")
-
-            # Update speed if no speed boost is active
-            if "speed_boost" not in self.active_power_ups:
-                self.speed_boost_multiplier = 1.0
-                self._speed = self.base_speed
+        # Update durations and collect expired power-ups without allocating
+        expired_power_ups = self._expired_buf
+        expired_power_ups.clear()
+        active_power_ups = self.active_power_ups
+        for power_type, duration in active_power_ups.items():
+            # Only values change here, so storing while iterating is safe
+            duration -= 1
+            if duration <= 0:
+                expired_power_ups.append(power_type)
+            else:
+                active_power_ups[power_type] = duration
 
-        except Exception as e:
-            print(f"⚠️ Warning: Error updating power-ups: {e}")
+        # Remove expired power-ups
+        for power_type in expired_power_ups:
+            del active_power_ups[power_type]
+            self._remove_power_up_effect(power_type)
+            print(f"⏰ Power-up expired: {power_type.replace('_', ' ').title()}")
+
+        # Update speed if no speed boost is active
+        if "speed_boost" not in active_power_ups:
+            self.speed_boost_multiplier = 1.0
+            self.speed = self.base_speed
 
     def _remove_power_up_effect(self, power_type):
         """Remove the effect of a specific power-up type"""
         try:
             if power_type == "speed_boost":
                 self.speed_boost_multiplier = 1.0
-                self._speed = self.base_speed
+                self.speed = self.base_speed
         except Exception as e:
             print(f"⚠️ Warning: Failed to remove power-up effect: {e}")
 
@@ -225,41 +243,12 @@ class Player:
     def draw_invincible_effect(self, screen):
         """Draw visual effect when player is invincible"""
         if self.is_invincible():
-            # Create a flashing effect by drawing a different color
-            alpha = (self.invincibility_timer % 20) // 10  # Flash every 10 frames
-            if alpha == 0:
-                # Draw with a different color to show invincibility
-                pygame.draw.rect(screen, (0, 255, 255), self.rect)  # Cyan color
-
-    def activate_power_up(self, power_up, duration):
-        """Activate a power-up effect on the player"""
-        try:
-            effect_type = power_up.properties.get("effect", "")
-
-            if effect_type == "player_speed":
-                # Speed boost - increase player speed
-                self.speed = self.speed + 2  # Boost by 2 units
-                # Schedule speed restoration
-                # This would need to be handled by the game loop
-
-            elif effect_type == "lives":
-                # Extra life - this would be handled by the game class
-                pass  # Game class handles life increases
-
-            elif effect_type == "invincibility":
-                # Temporary invincibility
-                self.make_invincible()
-                # Extend invincibility duration
-                self.invincibility_timer = max(self.invincibility_timer, duration)
-
-            print(f"⚡ Power-up activated: {power_up.get_effect_description()}")
-
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to activate power-up: {e}")
+            # Alternate between cyan and the normal color every 10 frames
+            screen.blit(self._flash_surfaces[self.invincibility_timer % 20], self.rect)
 
     def restore_speed(self, original_speed):
         """Restore player speed to original value"""
         try:
-            self.speed = original_speed
+            self.set_speed(original_speed)
         except Exception as e:
             print(f"⚠️ Warning: Failed to restore player speed: {e}")
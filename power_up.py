@@ -4,12 +4,46 @@ Handles power-up spawning, collection, and effects.
 """
 
 import pygame
-import random
+from enum import IntEnum
+from random import choice, randint
+
+
+class PowerUpKind(IntEnum):
+    """Power-up effects, numbered so they can index per-kind lookup tables"""
+    SPEED_BOOST = 0
+    SLOW_MOTION = 1
+    EXTRA_LIFE = 2
+    SHIELD = 3
+
+
+# Config "effect" names mapped to their power-up kind
+EFFECT_KINDS = {
+    "player_speed": PowerUpKind.SPEED_BOOST,
+    "enemy_speed": PowerUpKind.SLOW_MOTION,
+    "lives": PowerUpKind.EXTRA_LIFE,
+    "invincibility": PowerUpKind.SHIELD,
+}
 
 
 class PowerUp:
     """Power-up that provides temporary benefits when collected"""
 
+    __slots__ = ("config", "_type_names", "rect", "power_type", "properties", "color", "kind", "surface")
+
+    FALL_SPEED = 2  # Pixels per step, slower than enemies so they're collectible
+
+    # Display names for the configured power-up types
+    _DESCRIPTIONS = {
+        "speed_boost": "Speed Boost",
+        "slow_motion": "Slow Motion",
+        "extra_life": "Extra Life",
+        "shield": "Shield"
+    }
+
+    # Pre-rendered power-up squares keyed by (size, color), shared by every
+    # power-up of the same look and built on first use
+    _surfaces = {}
+
     def __init__(self, config, x=None, y=None, power_type=None):
         """
         Initialize power-up with configuration and position.
@@ -22,35 +56,45 @@ class PowerUp:
         """
         try:
             self.config = config
+            self._type_names = tuple(config.POWER_UP_TYPES)  # Picked from by reset()
+            self.rect = pygame.Rect(0, 0, self.config.POWER_UP_SIZE, self.config.POWER_UP_SIZE)
+            self.reset(x, y, power_type)
+        except Exception as e:
+            raise RuntimeError(f"Failed to initialize power-up: {e}")
 
-            # Set position
-            if x is None:
-                x = random.randint(self.config.POWER_UP_SIZE,
-                                   self.config.WIDTH - self.config.POWER_UP_SIZE)
-            if y is None:
-                y = -self.config.POWER_UP_SIZE
-
-            self.rect = pygame.Rect(x, y, self.config.POWER_UP_SIZE, self.config.POWER_UP_SIZE)
-
-            # Set power-up type
-            if power_type is None:
-                power_type = random.choice(list(self.config.POWER_UP_TYPES.keys()))
-            self.power_type = power_type
+    def reset(self, x=None, y=None, power_type=None):
+        """
+        Place the power-up and pick its type, so a collected or off-screen
+        power-up can be reused for a new spawn.
 
-            # Get properties for this power-up type
-            self.properties = self.config.POWER_UP_TYPES.get(self.power_type, {})
-            self.color = self.properties.get("color", (255, 255, 255))
+        Args:
+            x: X position (random if None)
+            y: Y position (top if None)
+            power_type: Specific power-up type (random if None)
+        """
+        # Set position
+        if x is None:
+            x = randint(self.config.POWER_UP_SIZE,
+                        self.config.WIDTH - self.config.POWER_UP_SIZE)
+        if y is None:
+            y = -self.config.POWER_UP_SIZE
+        self.rect.topleft = (x, y)
+
+        # Set power-up type
+        if power_type is None:
+            power_type = choice(self._type_names)
+        self.power_type = power_type
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize power-up: {e}")
+        # Get properties for this power-up type
+        self.properties = self.config.POWER_UP_TYPES.get(self.power_type, {})
+        self.color = self.properties.get("color", (255, 255, 255))
+        self.kind = EFFECT_KINDS.get(self.properties.get("effect"))  # None if unknown
+        self.surface = self._get_surface(self.config.POWER_UP_SIZE, self.color)
 
     def move(self):
         """Move power-up downward (slower than enemies)"""
-        try:
-            # Move slower than enemies so they're collectible
-            self.rect.y += 2
-        except Exception as e:
-            print(f"\u26a0\ufe0f Warning: Power-up movement error: {e}")
+        # Move slower than enemies so they're collectible
+        self.rect.move_ip(0, self.FALL_SPEED)
 
     def draw(self, screen):
         """
@@ -59,32 +103,47 @@ class PowerUp:
         Args:
             screen: Pygame surface to draw on
         """
-        try:
+        screen.blit(self.surface, self.rect)
+
+    @classmethod
+    def _get_surface(cls, size, color):
+        """
+        Get the pre-rendered square for a power-up size and color.
+
+        Requires the display mode to be set (the surface is converted to its
+        pixel format).
+
+        Args:
+            size: Width and height of the square
+            color: Fill color of the power-up
+
+        Returns:
+            pygame.Surface: Square with border and inner highlight
+        """
+        key = (size, color)
+        surface = cls._surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((size, size)).convert()
+            rect = surface.get_rect()
+
             # Draw the power-up square
-            pygame.draw.rect(screen, self.color, self.rect)
+            pygame.draw.rect(surface, color, rect)
 
             # Add a border to make it more visible
             border_color = (255, 255, 255)  # White border
-            pygame.draw.rect(screen, border_color, self.rect, 2)
+            pygame.draw.rect(surface, border_color, rect, 2)
 
             # Add a small inner highlight
-            inner_rect = pygame.Rect(
-                self.rect.x + 3, self.rect.y + 3,
-                self.rect.width - 6, self.rect.height - 6
-            )
-            highlight_color = tuple(min(255, c + 50) for c in self.color)
-            pygame.draw.rect(screen, highlight_color, inner_rect)
+            inner_rect = rect.inflate(-6, -6)
+            highlight_color = tuple(min(255, c + 50) for c in color)
+            pygame.draw.rect(surface, highlight_color, inner_rect)
 
-        except Exception as e:
-            print(f"\u26a0\ufe0f Warning: Failed to draw power-up: {e}")
+            cls._surfaces[key] = surface
+        return surface
 
     def is_off_screen(self):
         """Check if power-up has moved off screen"""
-        try:
-            return self.rect.top > self.config.HEIGHT
-        except Exception as e:
-            print(f"\u26a0\ufe0f Warning: Error checking if power-up is off screen: {e}")
-            return False
+        return self.rect.top > self.config.HEIGHT
 
     def collides_with(self, player):
         """
@@ -96,62 +155,74 @@ class PowerUp:
         Returns:
             bool: True if collision detected, False otherwise
         """
-        try:
-            return self.rect.colliderect(player.rect)
-        except Exception as e:
-            print(f"\u26a0\ufe0f Warning: Error checking power-up collision: {e}")
-            return False
+        return self.rect.colliderect(player.rect)
 
     def get_effect_description(self):
         """Get a description of what this power-up does"""
-        try:
-            descriptions = {
-                "speed_boost": "Speed Boost",
-                "slow_motion": "Slow Motion",
-                "extra_life": "Extra Life",
-                "shield": "Shield"
-            }
-            return descriptions.get(self.power_type, self.power_type)
-        except:
-            return self.power_type
+        return self._DESCRIPTIONS.get(self.power_type, self.power_type)
 
     def get_position(self):
         """Get current power-up position"""
-        try:
-            return (self.rect.x, self.rect.y)
-        except Exception as e:
-            print(f"\u26a0\ufe0f Warning: Failed to get power-up position: {e}")
-            return (0, 0)
+        return (self.rect.x, self.rect.y)
 
 
 class ActivePowerUp:
     """Represents an active power-up effect on the player"""
 
-    def __init__(self, power_type, duration):
+    __slots__ = ("power_type", "kind", "duration", "expires_at", "_display_seconds", "_display")
+
+    def __init__(self, power_type, duration, kind=None, start_step=0):
         """
         Initialize active power-up.
 
         Args:
             power_type: Type of power-up
-            duration: Duration in frames
+            duration: Duration in logic steps
+            kind: PowerUpKind of the effect (used to dispatch its expiry)
+            start_step: Game logic step the effect was collected on
+        """
+        self.restart(power_type, duration, kind, start_step)
+
+    def restart(self, power_type, duration, kind=None, start_step=0):
+        """
+        Reset this effect for a newly collected power-up, so expired
+        instances can be reused instead of allocating new ones.
+
+        Args:
+            power_type: Type of power-up
+            duration: Duration in logic steps
+            kind: PowerUpKind of the effect (used to dispatch its expiry)
+            start_step: Game logic step the effect was collected on
         """
         self.power_type = power_type
+        self.kind = kind
         self.duration = duration
-        self.remaining_time = duration
+        # Nothing counts down per step; the effect ends at a fixed step number
+        self.expires_at = start_step + duration
 
-    def update(self):
-        """Update the power-up timer"""
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
+        # Last remaining-time text, rebuilt only when the whole seconds change
+        self._display_seconds = -1
+        self._display = "0s"
 
-    def is_expired(self):
-        """Check if power-up has expired"""
-        return self.remaining_time <= 0
+    def is_expired(self, step):
+        """
+        Check if power-up has expired.
 
-    def get_remaining_time_display(self):
-        """Get remaining time in seconds for display"""
-        try:
-            seconds = self.remaining_time // 60  # Assuming 60 FPS
-            return f"{seconds}s"
-        except:
-            return "0s"
+        Args:
+            step: Current game logic step
+        """
+        return step >= self.expires_at
+
+    def get_remaining_time_display(self, step, steps_per_second):
+        """
+        Get remaining time in seconds for display.
+
+        Args:
+            step: Current game logic step
+            steps_per_second: Logic steps run per second (config.UPDATE_RATE)
+        """
+        seconds = max(0, self.expires_at - step) // steps_per_second
+        if seconds != self._display_seconds:
+            self._display_seconds = seconds
+            self._display = f"{seconds}s"
+        return self._display
@@ -3,12 +3,18 @@ Spawn Manager module for handling enemy spawning with advanced progression.
 Manages spawn rates, burst spawning, and dynamic spawn patterns.
 """
 
-import random
 import math
+from random import choices, random
 
 
 class SpawnManager:
     """Manages enemy spawning with advanced progression and patterns"""
+
+    __slots__ = (
+        "config", "current_spawn_rate", "current_pattern_index", "_patterns", "_current_pattern",
+        "burst_timer", "pattern_timer", "last_burst_score", "_next_burst_score", "next_pattern_score",
+        "_x_range", "_x_pool", "_pattern_funcs",
+    )
     
     def __init__(self, config):
         """
@@ -20,9 +26,27 @@ class SpawnManager:
         self.config = config
         self.current_spawn_rate = config.ENEMY_BASE_SPAWN_RATE
         self.current_pattern_index = 0
+        self._patterns = tuple(config.SPAWN_PATTERNS)
+        self._current_pattern = self._patterns[0] if self._patterns else "random"  # Name at current_pattern_index
         self.burst_timer = 0
         self.pattern_timer = 0
         self.last_burst_score = 0
+        # Score at which the next burst is due (BURST_SPAWN_INTERVAL after the last)
+        self._next_burst_score = config.BURST_SPAWN_INTERVAL if config.SPAWN_BURST_ENABLED else float("inf")
+        # Score at which update_pattern() next has work to do
+        self.next_pattern_score = config.PATTERN_CHANGE_INTERVAL if config.DYNAMIC_SPAWN_PATTERNS else float("inf")
+
+        # Pre-drawn random x positions, refilled in batches when exhausted
+        self._x_range = range(config.WIDTH - config.ENEMY_WIDTH + 1)
+        self._x_pool = []
+
+        # Position generators for each spawn pattern name
+        self._pattern_funcs = {
+            "random": self._get_random_positions,
+            "wave": self._get_wave_positions,
+            "clustered": self._get_clustered_positions,
+            "alternating": self._get_alternating_positions,
+        }
         
     def update_spawn_rate(self, difficulty_level):
         """
@@ -67,12 +91,11 @@ class SpawnManager:
         Returns:
             bool: True if burst spawn should occur
         """
-        if not self.config.SPAWN_BURST_ENABLED:
-            return False
-            
-        # Check if enough time has passed since last burst
-        if score - self.last_burst_score >= self.config.BURST_SPAWN_INTERVAL:
+        # Check if enough points have been scored since the last burst
+        # (never true when burst spawning is disabled)
+        if score >= self._next_burst_score:
             self.last_burst_score = score
+            self._next_burst_score = score + self.config.BURST_SPAWN_INTERVAL
             return True
             
         return False
@@ -90,57 +113,55 @@ class SpawnManager:
         """
         try:
             if pattern_type is None:
-                pattern_type = self.config.SPAWN_PATTERNS[self.current_pattern_index]
-            
-            positions = []
-            
-            if pattern_type == "random":
-                positions = self._get_random_positions(count)
-            elif pattern_type == "wave":
-                positions = self._get_wave_positions(count)
-            elif pattern_type == "clustered":
-                positions = self._get_clustered_positions(count)
-            elif pattern_type == "alternating":
-                positions = self._get_alternating_positions(count)
-            else:
-                # Fallback to random
-                positions = self._get_random_positions(count)
-                
-            return positions
+                pattern_type = self._current_pattern
+
+            # Unknown patterns fall back to random
+            return self._pattern_funcs.get(pattern_type, self._get_random_positions)(count)
             
         except Exception as e:
             print(f"⚠️ Warning: Error generating spawn positions: {e}")
             # Fallback to random positions
             return self._get_random_positions(count)
     
+    def _next_random_x(self):
+        """Get the next random spawn x position from the pre-drawn pool"""
+        if not self._x_pool:
+            # One choices() call draws the whole batch far cheaper than
+            # calling randint once per spawn
+            self._x_pool = choices(self._x_range, k=self.config.SPAWN_X_POOL_SIZE)
+        return self._x_pool.pop()
+
     def _get_random_positions(self, count):
         """Generate random spawn positions"""
-        positions = []
-        for _ in range(count):
-            x = random.randint(0, self.config.WIDTH - self.config.ENEMY_WIDTH)
-            y = -self.config.ENEMY_HEIGHT
-            positions.append((x, y))
-        return positions
+        next_x = self._next_random_x
+        y = -self.config.ENEMY_HEIGHT
+        return [(next_x(), y) for _ in range(count)]
     
     def _get_wave_positions(self, count):
         """Generate wave-like spawn positions"""
         positions = []
         if count == 1:
             return self._get_random_positions(1)
+
+        # Loop invariants: wave start and span, clamp limit and spawn height
+        wave_start = self.config.WIDTH * 0.1
+        wave_span = self.config.WIDTH * 0.8
+        max_x = self.config.WIDTH - self.config.ENEMY_WIDTH
+        y = -self.config.ENEMY_HEIGHT
+        last = count - 1
             
         # Create a wave pattern across the screen
         for i in range(count):
-            # Use sine wave for x position
-            wave_progress = i / (count - 1) if count > 1 else 0.5
-            wave_x = int(self.config.WIDTH * 0.1 + 
-                        (self.config.WIDTH * 0.8) * wave_progress)
+            # Spread x positions evenly across the wave span
+            wave_x = int(wave_start + wave_span * (i / last))
             
-            # Add some randomness to the wave
-            random_offset = random.randint(-20, 20)
-            wave_x = max(0, min(self.config.WIDTH - self.config.ENEMY_WIDTH, 
-                               wave_x + random_offset))
+            # Add some randomness to the wave (-20..20)
+            wave_x += int(random() * 41) - 20
+            if wave_x < 0:
+                wave_x = 0
+            elif wave_x > max_x:
+                wave_x = max_x
             
-            y = -self.config.ENEMY_HEIGHT
             positions.append((wave_x, y))
             
         return positions
@@ -150,19 +171,23 @@ class SpawnManager:
         positions = []
         if count == 1:
             return self._get_random_positions(1)
+
+        max_x = self.config.WIDTH - self.config.ENEMY_WIDTH
+        y = -self.config.ENEMY_HEIGHT
             
         # Choose a cluster center
-        cluster_center = random.randint(self.config.ENEMY_WIDTH, 
-                                      self.config.WIDTH - self.config.ENEMY_WIDTH)
+        cluster_center = self.config.ENEMY_WIDTH + int(random() * (max_x - self.config.ENEMY_WIDTH + 1))
         
-        for i in range(count):
-            # Spread enemies around the cluster center
-            spread = 30  # Maximum spread from center
-            x_offset = random.randint(-spread, spread)
-            x = max(0, min(self.config.WIDTH - self.config.ENEMY_WIDTH, 
-                          cluster_center + x_offset))
+        spread = 30  # Maximum spread from center
+        spread_span = 2 * spread + 1
+        for _ in range(count):
+            # Spread enemies around the cluster center (-spread..spread)
+            x = cluster_center + int(random() * spread_span) - spread
+            if x < 0:
+                x = 0
+            elif x > max_x:
+                x = max_x
             
-            y = -self.config.ENEMY_HEIGHT
             positions.append((x, y))
             
         return positions
@@ -172,17 +197,21 @@ class SpawnManager:
         positions = []
         if count == 1:
             return self._get_random_positions(1)
+
+        # Inclusive ranges 0..left_span-1 and right_min..right_min+right_span-1
+        left_span = self.config.WIDTH // 3 + 1
+        right_min = 2 * self.config.WIDTH // 3
+        right_span = self.config.WIDTH - self.config.ENEMY_WIDTH - right_min + 1
+        y = -self.config.ENEMY_HEIGHT
             
         for i in range(count):
             if i % 2 == 0:
                 # Left side
-                x = random.randint(0, self.config.WIDTH // 3)
+                x = int(random() * left_span)
             else:
                 # Right side
-                x = random.randint(2 * self.config.WIDTH // 3, 
-                                 self.config.WIDTH - self.config.ENEMY_WIDTH)
+                x = right_min + int(random() * right_span)
             
-            y = -self.config.ENEMY_HEIGHT
             positions.append((x, y))
             
         return positions
@@ -200,25 +229,24 @@ class SpawnManager:
                 
             # Change pattern every PATTERN_CHANGE_INTERVAL points
             if score - self.pattern_timer >= self.config.PATTERN_CHANGE_INTERVAL:
-                self.current_pattern_index = (self.current_pattern_index + 1) % len(self.config.SPAWN_PATTERNS)
+                self.current_pattern_index = (self.current_pattern_index + 1) % len(self._patterns)
+                self._current_pattern = self._patterns[self.current_pattern_index]
                 self.pattern_timer = score
-                print(f"🔄 Spawn pattern changed to: {self.config.SPAWN_PATTERNS[self.current_pattern_index]}")
+                self.next_pattern_score = score + self.config.PATTERN_CHANGE_INTERVAL
+                print(f"🔄 Spawn pattern changed to: {self._current_pattern}")
                 
         except Exception as e:
             print(f"⚠️ Warning: Error updating spawn pattern: {e}")
     
     def get_current_pattern_name(self):
         """Get the name of the current spawn pattern"""
-        try:
-            return self.config.SPAWN_PATTERNS[self.current_pattern_index]
-        except:
-            return "random"
+        return self._current_pattern
     
     def get_spawn_rate_display(self):
         """Get spawn rate for display purposes"""
         try:
-            # Convert frames to spawns per second for display
-            spawns_per_second = self.config.FPS / self.current_spawn_rate
+            # Convert logic steps to spawns per second for display
+            spawns_per_second = self.config.UPDATE_RATE / self.current_spawn_rate
             return f"{spawns_per_second:.1f}/s"
         except:
             return "N/A"